@@ -23,6 +23,7 @@ import os.path
 import re
 import subprocess
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from errno import EAGAIN, ENOENT
 from hashlib import sha1
 from io import BytesIO
@@ -41,6 +42,9 @@ from motioneye.utils.dtconv import pretty_date_time
 _PICTURE_EXTS = [".jpg"]
 _MOVIE_EXTS = [".avi", ".mp4", ".mov", ".swf", ".flv", ".mkv"]
 
+# upper bound for the number of threads scanning media directories in parallel
+_LIST_MEDIA_MAX_WORKERS = 8
+
 FFMPEG_CODEC_MAPPING = {
     "mpeg4": "mpeg4",
     "msmpeg4": "msmpeg4v2",
@@ -109,7 +113,7 @@ def do_list_media1(pipe, target_dir, exts, prefix, with_stat):
 
     # parent_pipe.close()
 
-    mf = _list_media_files(target_dir, exts, sub_path=prefix, with_stat=with_stat)
+    mf = _iter_media_files(target_dir, exts, sub_path=prefix, with_stat=with_stat)
     for p, st in mf:
         path = p[len(target_dir) :]
         if not path.startswith("/"):
@@ -147,7 +151,7 @@ def do_list_media1(pipe, target_dir, exts, prefix, with_stat):
 def do_zip(pipe, target_dir, exts, group, working):
     # parent_pipe.close()
 
-    mf = _list_media_files(target_dir, exts, sub_path=group, with_stat=False)
+    mf = _iter_media_files(target_dir, exts, sub_path=group, with_stat=False)
     paths = []
     for p, st in mf:  # st will be None when with_stat=False
         path = p[len(target_dir) :]
@@ -194,7 +198,7 @@ def do_zip(pipe, target_dir, exts, group, working):
 def do_list_media(pipe, target_dir, group):
     # parent_pipe.close()
 
-    mf = _list_media_files(target_dir, _PICTURE_EXTS, sub_path=group, with_stat=True)
+    mf = _iter_media_files(target_dir, _PICTURE_EXTS, sub_path=group, with_stat=True)
     for p, st in mf:
         timestamp = st.st_mtime
 
@@ -203,52 +207,111 @@ def do_list_media(pipe, target_dir, group):
     pipe.close()
 
 
-def _list_media_files(
+def _scan_media_dir(
+    dir_path: str, exts: typing.FrozenSet[str], with_stat: bool, recursive: bool
+) -> typing.Tuple[typing.List[tuple], typing.List[str]]:
+    media_files = []
+    sub_dirs = []
+    prefix = dir_path if dir_path.endswith(os.sep) else dir_path + os.sep
+
+    # scan through a directory descriptor, so that the DirEntry stat calls
+    # resolve names relative to it (fstatat) rather than walking the full path
+    dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(dir_fd) as it:
+            for entry in it:
+                name = entry.name
+
+                # ignore hidden files/dirs and other unwanted files
+                if name[0] == "." or name == "lastsnap.jpg":
+                    continue
+
+                # filter by extension first, so that discarded entries cost no I/O
+                dot = name.rfind(".")
+                ext = name[dot:].lower() if dot >= 0 else ""
+
+                if ext in exts and entry.is_file(follow_symlinks=False):
+                    # If stat is not needed, use None as placeholder
+                    st = None
+                    if with_stat:
+                        # always go through the DirEntry, which caches its stat result,
+                        # rather than calling os.stat() on the full path again;
+                        # stat call may fail due to race conditions or permission issues
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except Exception as e:
+                            logging.error(f"stat failed: {e}")
+                            continue
+
+                    media_files.append((prefix + name, st))
+
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(prefix + name)
+
+    finally:
+        os.close(dir_fd)
+
+    return media_files, sub_dirs
+
+
+def _iter_media_files(
     base_path: str,
     exts: typing.List[str],
     sub_path: str | None = None,
     with_stat: bool = True,
-) -> typing.List[tuple]:
-    # Determine scan path based on sub_path parameter
-    if sub_path is not None:
-        if sub_path == "ungrouped":
-            sub_path = ""
+) -> typing.Iterator[tuple]:
+    # Yields (path, stat) tuples as each directory gets scanned; the stat objects
+    # are the ones cached by the os.DirEntry instances during the scan
+    # (or None when with_stat is False)
 
-        scan_path = os.path.join(base_path, sub_path)
-        if not os.path.exists(scan_path):
-            return []
-    else:
+    # recurse into subdirectories only when no sub_path filter is set
+    recursive = sub_path is None
+
+    # Determine scan path based on sub_path parameter, once for the whole walk
+    if recursive or sub_path in ("ungrouped", ""):
         scan_path = base_path
+    else:
+        scan_path = os.path.join(base_path, sub_path)
 
-    media_files = []
-    for entry in os.scandir(scan_path):
-        # ignore hidden files/dirs and other unwanted files
-        if entry.name.startswith(".") or entry.name == "lastsnap.jpg":
-            continue
+    exts = frozenset(e.lower() for e in exts)
+    scan = functools.partial(
+        _scan_media_dir, exts=exts, with_stat=with_stat, recursive=recursive
+    )
 
-        # check if it's a file first (most common case)
-        if entry.is_file(follow_symlinks=False):
-            # filter by extension before calling stat
-            if not any(entry.path.lower().endswith(e) for e in exts):
-                continue
+    # a missing group (or one that is not a directory) is detected by the scan
+    # itself, saving a separate stat call
+    try:
+        media_files, dirs = scan(scan_path)
+    except (FileNotFoundError, NotADirectoryError):
+        if recursive:
+            raise
 
-            # If stat is not needed, use None as placeholder
-            st = None
-            if with_stat:
-                # stat call may fail due to race conditions or permission issues
-                try:
-                    st = entry.stat(follow_symlinks=False)
-                except Exception as e:
-                    logging.error(f"stat failed: {e}")
-                    continue
+        return
+
+    yield from media_files
+    if not dirs:
+        return
 
-            media_files.append((entry.path, st))
+    # walk the tree one level at a time, scanning the directories of each level
+    # concurrently; directory reads release the GIL, so their latencies overlap
+    max_workers = min(_LIST_MEDIA_MAX_WORKERS, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while dirs:
+            next_dirs = []
+            for media_files, sub_dirs in executor.map(scan, dirs):
+                yield from media_files
+                next_dirs.extend(sub_dirs)
 
-        # recurse into subdirectories only when no sub_path filter is set
-        elif sub_path is None and entry.is_dir(follow_symlinks=False):
-            media_files.extend(_list_media_files(entry.path, exts, with_stat=with_stat))
+            dirs = next_dirs
 
-    return media_files
+
+def _list_media_files(
+    base_path: str,
+    exts: typing.List[str],
+    sub_path: str | None = None,
+    with_stat: bool = True,
+) -> typing.List[tuple]:
+    return list(_iter_media_files(base_path, exts, sub_path, with_stat))
 
 
 def _remove_older_files(
@@ -308,7 +371,7 @@ def _remove_older_files(
 def _do_list_media(pipe, target_dir, exts, sub_path, with_stat):
     from mimetypes import guess_type
 
-    mf = _list_media_files(target_dir, exts, sub_path, with_stat)
+    mf = _iter_media_files(target_dir, exts, sub_path, with_stat)
     for p, st in mf:
         path = p[len(target_dir) :]
         if not path.startswith("/"):
@@ -344,7 +407,7 @@ def _do_list_media(pipe, target_dir, exts, sub_path, with_stat):
 
 
 def _do_zip(pipe, target_dir, exts, sub_path, working):
-    mf = _list_media_files(target_dir, exts, sub_path, with_stat=False)
+    mf = _iter_media_files(target_dir, exts, sub_path, with_stat=False)
     paths = []
     for p, st in mf:  # st will be None when with_stat=False
         path = p[len(target_dir) :]
@@ -389,7 +452,7 @@ def _do_zip(pipe, target_dir, exts, sub_path, working):
 
 
 def _do_list_pictures(pipe, target_dir, sub_path):
-    mf = _list_media_files(target_dir, _PICTURE_EXTS, sub_path, with_stat=True)
+    mf = _iter_media_files(target_dir, _PICTURE_EXTS, sub_path, with_stat=True)
     for p, st in mf:
         timestamp = st.st_mtime
 
@@ -22,7 +22,7 @@ from tempfile import mkdtemp
 from time import time
 
 from motioneye import mediafiles
-from motioneye.mediafiles import _list_media_files
+from motioneye.mediafiles import _iter_media_files, _list_media_files
 
 
 class TestMediaFiles(unittest.TestCase):
@@ -190,6 +190,10 @@ class TestMediaFiles(unittest.TestCase):
         # Should return empty list
         self.assertEqual(len(result), 0)
 
+        # A sub_path that is a file rather than a directory should also return empty list
+        result = _list_media_files(self.test_dir, movie_exts, sub_path='readme.txt')
+        self.assertEqual(len(result), 0)
+
     def test_list_media_files_empty_directory(self):
         """Test _list_media_files on an empty directory."""
         # Create a new empty directory for this test
@@ -281,6 +285,26 @@ class TestMediaFiles(unittest.TestCase):
         )
         self.assertEqual(result_paths, expected_files)
 
+    def test_iter_media_files_streams_same_entries(self):
+        """Test that _iter_media_files lazily yields the entries _list_media_files returns."""
+        all_exts = ['.mp4', '.avi', '.mkv', '.jpg']
+        it = _iter_media_files(self.test_dir, all_exts)
+
+        # Should be a lazy iterator, not a materialized list
+        self.assertIs(iter(it), it)
+
+        result_paths = sorted([path for path, st in it])
+        expected_files = sorted(
+            [path for path, st in _list_media_files(self.test_dir, all_exts)]
+        )
+        self.assertEqual(result_paths, expected_files)
+
+        # A missing sub_path should yield nothing
+        self.assertEqual(
+            list(_iter_media_files(self.test_dir, all_exts, sub_path='nonexistent')),
+            [],
+        )
+
 
 class TestMediaFilesPathTraversal(unittest.TestCase):
     """Tests verifying that path traversal elements are rejected in mediafiles functions."""